@@ -12,6 +12,7 @@ This test verifies:
 
 import sys
 import os
+import re
 from pathlib import Path
 
 # Add the SDK to the path
@@ -20,6 +21,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../dist/python/sr
 from circular_protocol_api import CircularProtocolAPI
 import asyncio
 
+# [export ]KEY=value assignment; value may be double-quoted, single-quoted or
+# bare. A '#' only starts a comment when whitespace precedes it, so values
+# such as passwords or URL fragments keep their '#'.
+_ENV_LINE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))(?:[ \t]+#[^\n]*)?[ \t]*$""",
+    re.MULTILINE,
+)
+
 # Load environment variables from .env file
 def load_env():
     """Load environment variables from .env file"""
@@ -27,14 +37,14 @@ def load_env():
     env_vars = {}
 
     if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Remove quotes if present
-                    value = value.strip().strip("'").strip('"')
-                    env_vars[key] = value
+        for match in _ENV_LINE.finditer(env_path.read_text()):
+            key, double_quoted, single_quoted, bare = match.groups()
+            if double_quoted is not None:
+                env_vars[key] = double_quoted
+            elif single_quoted is not None:
+                env_vars[key] = single_quoted
+            else:
+                env_vars[key] = bare
 
     return env_vars
 
@@ -66,7 +76,6 @@ async def test_real_api():
     timestamp = api.get_formatted_timestamp()
     print(f'  Timestamp: {timestamp}')
 
-    import re
     timestamp_regex = r'^\d{4}:\d{2}:\d{2}-\d{2}:\d{2}:\d{2}$'
     if not re.match(timestamp_regex, timestamp):
         raise ValueError('Invalid timestamp format')
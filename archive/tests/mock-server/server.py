@@ -5,386 +5,622 @@ Simulates all 24 API endpoints with realistic mock responses
 Used for testing generated TypeScript and Python SDKs
 """
 
+import functools
 import json
+import os
 import re
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-from typing import Dict, Any, Optional
+import signal
+import socket
+import sys
+import traceback
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union,
+)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a response body as compact JSON"""
+    return json.dumps(data, separators=(",", ":")).encode()
+
 
 # Mock configuration
 VERSION = "1.0.8"
 PORT = 8080
 
+# Per-request access logging is opt-in (MOCK_LOG=1); errors are always logged
+ACCESS_LOG = os.environ.get("MOCK_LOG") == "1"
+
+# Request shapes handled by MockAPIHandler's own parser; anything else is
+# passed to BaseHTTPRequestHandler.parse_request
+_MAX_LINE = 65536
+_MAX_HEADERS = 100
+_FAST_METHODS = frozenset((b"POST", b"OPTIONS"))
+_FAST_VERSIONS = frozenset((b"HTTP/1.0", b"HTTP/1.1"))
+
+# Endpoints whose response never depends on the request, serialized once at
+# import time and written verbatim on every hit
+_STATIC: Dict[str, bytes] = {path: _dumps(data) for path, data in {
+    # Wallet API
+    "/getWalletNonce": {
+        "Result": 200,
+        "Response": {
+            "Nonce": 42
+        }
+    },
+    "/registerWallet": {
+        "Result": 200,
+        "Response": {
+            "TransactionID": "0xcccc...cccc",
+            "Status": "pending"
+        }
+    },
+
+    # Transaction API
+    "/getTransactionbyNode": {
+        "Result": 200,
+        "Response": {
+            "Transactions": [],
+            "Count": 0
+        }
+    },
+    "/getTransactionbyDate": {
+        "Result": 200,
+        "Response": {
+            "Transactions": [],
+            "Count": 0
+        }
+    },
+
+    # Block API
+    "/getBlockRange": {
+        "Result": 200,
+        "Response": {
+            "Blocks": [],
+            "Count": 0
+        }
+    },
+    "/getBlockCount": {
+        "Result": 200,
+        "Response": {
+            "BlockCount": 123456
+        }
+    },
+    "/getAnalytics": {
+        "Result": 200,
+        "Response": {
+            "TotalTransactions": 1000000,
+            "TotalWallets": 50000,
+            "TotalAssets": 100,
+            "BlockHeight": 123456
+        }
+    },
+
+    # Smart Contract API
+    "/testContract": {
+        "Result": 200,
+        "Response": "Contract execution successful"
+    },
+    "/callContract": {
+        "Result": 200,
+        "Response": {
+            "Output": "0x1234",
+            "GasUsed": 21000
+        }
+    },
+
+    # Asset API
+    "/getAssetList": {
+        "Result": 200,
+        "Response": {
+            "Assets": ["CIRX", "TEST", "DEMO"],
+            "Count": 3
+        }
+    },
+    "/getAssetSupply": {
+        "Result": 200,
+        "Response": {
+            "TotalSupply": 1000000000,
+            "CirculatingSupply": 750000000,
+            "ResidualSupply": 250000000
+        }
+    },
+
+    # Network API
+    "/getBlockchains": {
+        "Result": 200,
+        "Response": [
+            {"Name": "MainNet", "ChainID": "1", "Active": True},
+            {"Name": "TestNet", "ChainID": "2", "Active": True},
+            {"Name": "DevNet", "ChainID": "3", "Active": True}
+        ]
+    },
+}.items()}
+
+
+# Responses that echo a single request field. Each is serialized once with a
+# placeholder string, which _send_template swaps for the JSON-encoded value.
+_SLOT_VALUE = "__SLOT__"
+_SLOT = _dumps(_SLOT_VALUE)
+
+# Characters that never need JSON escaping and cover addresses, transaction
+# ids, asset names and domains; anything else goes through the encoder
+_UNSAFE_CHAR = re.compile(r"[^0-9A-Za-z._:\-]").search
+
+
+def _template(response: Any) -> bytes:
+    """Serialize a 200 response whose slot is marked with _SLOT_VALUE"""
+    return _dumps({"Result": 200, "Response": response})
+
+
+def _block_number(value: Any) -> int:
+    """BlockNumber as an int; JSON clients may send a number or a string"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return 12345
+
+
+class _EchoEndpoint(NamedTuple):
+    """Response template plus the request field spliced into its slot"""
+    template: bytes
+    field: str
+    default: Any
+    coerce: Optional[Callable[[Any], Any]] = None
+
+
+# Endpoints whose response echoes one request field, dispatched by do_POST
+_ECHO_ENDPOINTS: Dict[str, _EchoEndpoint] = {
+    # Wallet API
+    "/checkWallet": _EchoEndpoint(_template({
+        "exists": True,
+        "address": _SLOT_VALUE
+    }), "Address", ""),
+    "/getWallet": _EchoEndpoint(_template({
+        "Address": _SLOT_VALUE,
+        "Balance": 1000000,
+        "Nonce": 42,
+        "Registered": True
+    }), "Address", ""),
+    "/getLatestTransactions": _EchoEndpoint(_template({
+        "Transactions": [
+            {
+                "ID": "0xabcd...1234",
+                "From": _SLOT_VALUE,
+                "To": "0x9999...9999",
+                "Amount": 100,
+                "Timestamp": "2024-01-15:10:30:00"
+            }
+        ],
+        "Count": 1
+    }), "Address", ""),
+    "/getWalletBalance": _EchoEndpoint(_template({
+        "Balance": 500000,
+        "Asset": _SLOT_VALUE
+    }), "Asset", "CIRX"),
+
+    # Transaction API
+    "/sendTransaction": _EchoEndpoint(_template({
+        "TransactionID": _SLOT_VALUE,
+        "Status": "pending"
+    }), "ID", "0xabcd...efgh"),
+    "/getPendingTransaction": _EchoEndpoint(_template({
+        "TransactionID": _SLOT_VALUE,
+        "Status": "pending",
+        "Timestamp": "2024-01-15:10:30:00"
+    }), "ID", ""),
+    "/getTransactionbyID": _EchoEndpoint(_template({
+        "Transactions": [
+            {
+                "ID": _SLOT_VALUE,
+                "From": "0xaaaa...aaaa",
+                "To": "0xbbbb...bbbb",
+                "Amount": 100,
+                "Status": "confirmed"
+            }
+        ]
+    }), "ID", ""),
+    "/getTransactionbyAddress": _EchoEndpoint(_template({
+        "Transactions": [
+            {
+                "ID": "0xtx1",
+                "From": _SLOT_VALUE,
+                "To": "0xdest",
+                "Amount": 50
+            }
+        ],
+        "Count": 1
+    }), "Address", ""),
+
+    # Block API
+    "/getBlock": _EchoEndpoint(_template({
+        "BlockNumber": _SLOT_VALUE,
+        "Timestamp": "2024-01-15:10:30:00",
+        "Transactions": [],
+        "Hash": "0xblock123..."
+    }), "BlockNumber", 12345, _block_number),
+
+    # Asset API
+    "/getAsset": _EchoEndpoint(_template({
+        "AssetName": _SLOT_VALUE,
+        "TotalSupply": 1000000000,
+        "Decimals": 8,
+        "Owner": "0xbbbb...bbbb"
+    }), "AssetName", "CIRX"),
+    "/getVoucher": _EchoEndpoint(_template({
+        "Code": _SLOT_VALUE,
+        "Value": 100,
+        "Asset": "CIRX",
+        "Redeemed": False
+    }), "Code", ""),
+
+    # Domain API
+    "/getDomain": _EchoEndpoint(_template({
+        "Domain": _SLOT_VALUE,
+        "Address": "0xbbbb...bbbb"
+    }), "Domain", ""),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _response_head(protocol_version: str, status_code: int) -> bytes:
+    """Status line and fixed JSON headers, ending at the Content-Length value"""
+    return (
+        f"{protocol_version} {status_code} {HTTPStatus(status_code).phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        "Access-Control-Allow-Origin: *\r\n"
+        "Content-Length: "
+    ).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def _static_responses(protocol_version: str) -> Mapping[str, bytes]:
+    """Complete 200 responses (head and body) for every _STATIC endpoint"""
+    head = _response_head(protocol_version, 200)
+    return MappingProxyType({
+        path: b"%b%d\r\n\r\n%b" % (head, len(body), body)
+        for path, body in _STATIC.items()
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _cors_reply(protocol_version: str) -> bytes:
+    """Complete response to a CORS preflight request"""
+    return (
+        f"{protocol_version} 200 OK\r\n"
+        "Access-Control-Allow-Origin: *\r\n"
+        "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+        "Access-Control-Allow-Headers: Content-Type\r\n"
+        "Content-Length: 0\r\n"
+        "\r\n"
+    ).encode()
+
 
 class MockAPIHandler(BaseHTTPRequestHandler):
     """Handles mock API requests for all Circular Protocol endpoints"""
 
+    # Persistent connections; every response carries Content-Length
+    protocol_version = "HTTP/1.1"
+
+    # Send small responses immediately instead of waiting on Nagle/delayed ACK
+    disable_nagle_algorithm = True
+
+    # Request body size, set by whichever parser handled the request
+    content_length: int = 0
+
     def log_message(self, format: str, *args) -> None:
         """Override to provide cleaner logging"""
         print(f"[{self.log_date_time_string()}] {format % args}")
 
+    def log_request(self, code: Any = "-", size: Any = "-") -> None:
+        """Log each request only when access logging is enabled"""
+        if ACCESS_LOG:
+            super().log_request(code, size)
+
+    def handle_one_request(self) -> None:
+        """Handle a single request, parsing plain POST/OPTIONS requests directly
+
+        http.client.parse_headers builds an email.message.Message for every
+        request. The SDK clients only send simple requests, and the mock only
+        needs Content-Length, Connection and Expect, so those are read straight
+        off the socket. Any other request line goes through the stdlib parser.
+        """
+        try:
+            line = self.rfile.readline(_MAX_LINE + 1)
+            if not line:
+                self.close_connection = True
+                return
+            words = line.split()
+            if (len(line) > _MAX_LINE or len(words) != 3
+                    or words[0] not in _FAST_METHODS
+                    or words[2] not in _FAST_VERSIONS):
+                self._handle_with_stdlib_parser(line)
+                return
+
+            self.raw_requestline = line
+            self.requestline = line.decode("iso-8859-1").rstrip("\r\n")
+            self.command, self.path, self.request_version = (
+                word.decode("iso-8859-1") for word in words
+            )
+            if not self._read_headers():
+                return
+            getattr(self, "do_" + self.command)()
+        except TimeoutError as e:
+            # A read or a write timed out; discard this connection
+            self.log_error("Request timed out: %r", e)
+            self.close_connection = True
+
+    def _read_headers(self) -> bool:
+        """Read the header block, keeping only what the mock server uses"""
+        keep_alive = self.request_version == "HTTP/1.1"
+        content_lengths: List[bytes] = []
+        transfer_encoding = False
+        expect_continue = False
+        for _ in range(_MAX_HEADERS + 1):
+            line = self.rfile.readline(_MAX_LINE + 1)
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(line) > _MAX_LINE:
+                self.send_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Line too long")
+                return False
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"content-length":
+                content_lengths.append(value)
+            elif name == b"transfer-encoding":
+                transfer_encoding = True
+            elif name == b"connection":
+                conntype = value.strip().lower()
+                if conntype == b"close":
+                    keep_alive = False
+                elif conntype == b"keep-alive":
+                    keep_alive = True
+            elif name == b"expect":
+                expect_continue = value.strip().lower() == b"100-continue"
+        else:
+            self.send_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+            return False
+
+        self.close_connection = not keep_alive
+        if not self._set_content_length(transfer_encoding, content_lengths):
+            return False
+        if expect_continue and self.request_version == "HTTP/1.1":
+            return self.handle_expect_100()
+        return True
+
+    def _handle_with_stdlib_parser(self, raw_requestline: bytes) -> None:
+        """Finish an unusual request with BaseHTTPRequestHandler's parser"""
+        self.raw_requestline = raw_requestline
+        if len(raw_requestline) > _MAX_LINE:
+            self.requestline = ""
+            self.request_version = ""
+            self.command = ""
+            self.send_error(HTTPStatus.REQUEST_URI_TOO_LONG)
+            return
+        if not self.parse_request():
+            return
+        if not self._set_content_length(
+                "Transfer-Encoding" in self.headers,
+                self.headers.get_all("Content-Length", [])):
+            return
+        method = getattr(self, "do_" + self.command, None)
+        if method is None:
+            self.send_error(
+                HTTPStatus.NOT_IMPLEMENTED,
+                "Unsupported method (%r)" % self.command)
+            return
+        method()
+
+    def _set_content_length(self, transfer_encoding: bool,
+                            content_lengths: Sequence[Union[bytes, str]]) -> bool:
+        """Store the request body size, sending an error if its framing is unusable"""
+        if transfer_encoding:
+            # Chunked bodies are not decoded, and reading on would take the
+            # chunk data for the next request on this connection
+            self.close_connection = True
+            self.send_error(HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding not supported")
+            return False
+        if len(content_lengths) > 1:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Duplicate Content-Length")
+            return False
+        try:
+            content_length = int(content_lengths[0]) if content_lengths else 0
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Bad Content-Length")
+            return False
+        self.content_length = content_length
+        return True
+
     def _send_response(self, status_code: int, data: Dict[str, Any]) -> None:
         """Send JSON response"""
-        self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self._send_raw(_dumps(data), status_code)
+
+    def _send_raw(self, payload: bytes, status_code: int = 200) -> None:
+        """Send an already-serialized JSON payload as a single write"""
+        self.log_request(status_code)
+        head = _response_head(self.protocol_version, status_code)
+        self.wfile.write(b"%b%d\r\n\r\n%b" % (head, len(payload), payload))
 
     def _get_request_body(self) -> Optional[Dict[str, Any]]:
         """Parse JSON request body"""
-        content_length = int(self.headers.get("Content-Length", 0))
-        if content_length > 0:
-            body = self.rfile.read(content_length)
-            return json.loads(body.decode())
+        if self.content_length > 0:
+            body = self.rfile.read(self.content_length)
+            return json.loads(body)
         return None
 
+    def _discard_request_body(self) -> None:
+        """Consume the request body unparsed to keep keep-alive framing intact"""
+        if self.content_length > 0:
+            self.rfile.read(self.content_length)
+
     def do_OPTIONS(self) -> None:
         """Handle CORS preflight"""
-        self.send_response(200)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
-        self.end_headers()
+        self._discard_request_body()
+        self.log_request(200)
+        self.wfile.write(_cors_reply(self.protocol_version))
 
     def do_POST(self) -> None:
         """Handle POST requests to all API endpoints"""
-        path = urlparse(self.path).path
-        body = self._get_request_body()
-
-        # Route to appropriate handler
-        handlers = {
-            # Wallet API
-            "/checkWallet": self._handle_check_wallet,
-            "/getWallet": self._handle_get_wallet,
-            "/getLatestTransactions": self._handle_get_latest_transactions,
-            "/getWalletBalance": self._handle_get_wallet_balance,
-            "/getWalletNonce": self._handle_get_wallet_nonce,
-            "/registerWallet": self._handle_register_wallet,
-
-            # Transaction API
-            "/sendTransaction": self._handle_send_transaction,
-            "/getPendingTransaction": self._handle_get_pending_transaction,
-            "/getTransactionbyID": self._handle_get_transaction_by_id,
-            "/getTransactionbyNode": self._handle_get_transaction_by_node,
-            "/getTransactionbyAddress": self._handle_get_transaction_by_address,
-            "/getTransactionbyDate": self._handle_get_transaction_by_date,
-
-            # Block API
-            "/getBlock": self._handle_get_block,
-            "/getBlockRange": self._handle_get_block_range,
-            "/getBlockCount": self._handle_get_block_count,
-            "/getAnalytics": self._handle_get_analytics,
-
-            # Smart Contract API
-            "/testContract": self._handle_test_contract,
-            "/callContract": self._handle_call_contract,
-
-            # Asset API
-            "/getAssetList": self._handle_get_asset_list,
-            "/getAsset": self._handle_get_asset,
-            "/getAssetSupply": self._handle_get_asset_supply,
-            "/getVoucher": self._handle_get_voucher,
-
-            # Domain API
-            "/getDomain": self._handle_get_domain,
-
-            # Network API
-            "/getBlockchains": self._handle_get_blockchains,
-        }
-
-        handler = handlers.get(path)
-        if handler:
-            handler(body or {})
-        else:
+        path = self.path
+        query = path.find("?")
+        if query != -1:
+            path = path[:query]
+
+        # Static responses ignore the request, so skip parsing its body and
+        # write the prebuilt response as is
+        static = _static_responses(self.protocol_version).get(path)
+        if static is not None:
+            self._discard_request_body()
+            self.log_request(200)
+            self.wfile.write(static)
+            return
+
+        endpoint = _ECHO_ENDPOINTS.get(path)
+        if endpoint is None:
+            self._discard_request_body()
             self._send_response(404, {
                 "Result": 404,
                 "Response": f"Endpoint not found: {path}"
             })
+            return
 
-    # Wallet API Handlers
-    def _handle_check_wallet(self, body: Dict[str, Any]) -> None:
-        address = body.get("Address", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "exists": True,
-                "address": address
-            }
-        })
-
-    def _handle_get_wallet(self, body: Dict[str, Any]) -> None:
-        address = body.get("Address", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Address": address,
-                "Balance": 1000000,
-                "Nonce": 42,
-                "Registered": True
-            }
-        })
-
-    def _handle_get_latest_transactions(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Transactions": [
-                    {
-                        "ID": "0xabcd...1234",
-                        "From": body.get("Address", ""),
-                        "To": "0x9999...9999",
-                        "Amount": 100,
-                        "Timestamp": "2024-01-15:10:30:00"
-                    }
-                ],
-                "Count": 1
-            }
-        })
-
-    def _handle_get_wallet_balance(self, body: Dict[str, Any]) -> None:
-        asset = body.get("Asset", "CIRX")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Balance": 500000,
-                "Asset": asset
-            }
-        })
+        body = self._get_request_body()
+        value = body.get(endpoint.field, endpoint.default) if body else endpoint.default
+        if endpoint.coerce is not None:
+            value = endpoint.coerce(value)
+        self._send_template(endpoint.template, value)
+
+    def _send_template(self, template: bytes, value: Any) -> None:
+        """Send a pre-serialized template with value spliced into its slot"""
+        if isinstance(value, str) and not _UNSAFE_CHAR(value):
+            encoded = b'"%b"' % value.encode()
+        else:
+            encoded = _dumps(value)
+        self._send_raw(template.replace(_SLOT, encoded))
 
-    def _handle_get_wallet_nonce(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Nonce": 42
-            }
-        })
-
-    def _handle_register_wallet(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "TransactionID": "0xcccc...cccc",
-                "Status": "pending"
-            }
-        })
-
-    # Transaction API Handlers
-    def _handle_send_transaction(self, body: Dict[str, Any]) -> None:
-        tx_id = body.get("ID", "0xabcd...efgh")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "TransactionID": tx_id,
-                "Status": "pending"
-            }
-        })
-
-    def _handle_get_pending_transaction(self, body: Dict[str, Any]) -> None:
-        tx_id = body.get("ID", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "TransactionID": tx_id,
-                "Status": "pending",
-                "Timestamp": "2024-01-15:10:30:00"
-            }
-        })
-
-    def _handle_get_transaction_by_id(self, body: Dict[str, Any]) -> None:
-        tx_id = body.get("ID", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Transactions": [
-                    {
-                        "ID": tx_id,
-                        "From": "0xaaaa...aaaa",
-                        "To": "0xbbbb...bbbb",
-                        "Amount": 100,
-                        "Status": "confirmed"
-                    }
-                ]
-            }
-        })
-
-    def _handle_get_transaction_by_node(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Transactions": [],
-                "Count": 0
-            }
-        })
-
-    def _handle_get_transaction_by_address(self, body: Dict[str, Any]) -> None:
-        address = body.get("Address", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Transactions": [
-                    {
-                        "ID": "0xtx1",
-                        "From": address,
-                        "To": "0xdest",
-                        "Amount": 50
-                    }
-                ],
-                "Count": 1
-            }
-        })
-
-    def _handle_get_transaction_by_date(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Transactions": [],
-                "Count": 0
-            }
-        })
-
-    # Block API Handlers
-    def _handle_get_block(self, body: Dict[str, Any]) -> None:
-        block_num = body.get("BlockNumber", "12345")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "BlockNumber": int(block_num) if block_num.isdigit() else 12345,
-                "Timestamp": "2024-01-15:10:30:00",
-                "Transactions": [],
-                "Hash": "0xblock123..."
-            }
-        })
-
-    def _handle_get_block_range(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Blocks": [],
-                "Count": 0
-            }
-        })
 
-    def _handle_get_block_count(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "BlockCount": 123456
-            }
-        })
-
-    def _handle_get_analytics(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "TotalTransactions": 1000000,
-                "TotalWallets": 50000,
-                "TotalAssets": 100,
-                "BlockHeight": 123456
-            }
-        })
-
-    # Smart Contract API Handlers
-    def _handle_test_contract(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": "Contract execution successful"
-        })
-
-    def _handle_call_contract(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Output": "0x1234",
-                "GasUsed": 21000
-            }
-        })
-
-    # Asset API Handlers
-    def _handle_get_asset_list(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Assets": ["CIRX", "TEST", "DEMO"],
-                "Count": 3
-            }
-        })
-
-    def _handle_get_asset(self, body: Dict[str, Any]) -> None:
-        asset_name = body.get("AssetName", "CIRX")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "AssetName": asset_name,
-                "TotalSupply": 1000000000,
-                "Decimals": 8,
-                "Owner": "0xbbbb...bbbb"
-            }
-        })
-
-    def _handle_get_asset_supply(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "TotalSupply": 1000000000,
-                "CirculatingSupply": 750000000,
-                "ResidualSupply": 250000000
-            }
-        })
-
-    def _handle_get_voucher(self, body: Dict[str, Any]) -> None:
-        code = body.get("Code", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Code": code,
-                "Value": 100,
-                "Asset": "CIRX",
-                "Redeemed": False
-            }
-        })
-
-    # Domain API Handlers
-    def _handle_get_domain(self, body: Dict[str, Any]) -> None:
-        domain = body.get("Domain", "")
-        self._send_response(200, {
-            "Result": 200,
-            "Response": {
-                "Domain": domain,
-                "Address": "0xbbbb...bbbb"
-            }
-        })
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """Threading server whose port can be shared by several worker processes"""
 
-    # Network API Handlers
-    def _handle_get_blockchains(self, body: Dict[str, Any]) -> None:
-        self._send_response(200, {
-            "Result": 200,
-            "Response": [
-                {"Name": "MainNet", "ChainID": "1", "Active": True},
-                {"Name": "TestNet", "ChainID": "2", "Active": True},
-                {"Name": "DevNet", "ChainID": "3", "Active": True}
-            ]
-        })
+    def server_bind(self) -> None:
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
 
 
-def run_server(port: int = PORT) -> None:
+def _run_worker(server_address: Tuple[str, int],
+                httpd: Optional[ThreadingHTTPServer] = None) -> None:
+    """Serve requests in a forked worker until interrupted, then exit"""
+    status = 0
+    try:
+        if httpd is None:
+            httpd = ReusePortHTTPServer(server_address, MockAPIHandler)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+def _supervise_workers(children: Set[int]) -> bool:
+    """Wait for every worker, stopping them all on SIGTERM, Ctrl+C or a crash
+
+    Returns True if any worker exited with an error.
+    """
+    failed = False
+    stopping = False
+
+    def stop(*_: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    while children:
+        try:
+            pid, status = os.wait()
+        except KeyboardInterrupt:
+            stop()
+            continue
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        exit_code = os.waitstatus_to_exitcode(status)
+        if exit_code != 0 and not (stopping and exit_code == -signal.SIGTERM):
+            failed = True
+            stop()
+    return failed
+
+
+def run_server(port: int = PORT, workers: int = 1) -> None:
     """Start the mock server"""
     server_address = ("", port)
-    httpd = HTTPServer(server_address, MockAPIHandler)
+    # Bind before printing the banner so a busy port fails loudly
+    if workers <= 1:
+        httpd = ThreadingHTTPServer(server_address, MockAPIHandler)
+    else:
+        # Probe without SO_REUSEPORT first; a running listener that set it
+        # would otherwise accept the bind and quietly share our traffic
+        ThreadingHTTPServer(server_address, MockAPIHandler).server_close()
+        httpd = ReusePortHTTPServer(server_address, MockAPIHandler)
 
     print(f"🔵 Circular Protocol Mock API Server")
     print(f"   Version: {VERSION}")
     print(f"   Listening on: http://localhost:{port}")
     print(f"   Endpoints: 24 API endpoints")
+    if workers > 1:
+        print(f"   Workers: {workers}")
     print(f"\nPress Ctrl+C to stop")
     print()
 
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\n\n✅ Mock server stopped")
-        httpd.shutdown()
+    if workers <= 1:
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n\n✅ Mock server stopped")
+            httpd.shutdown()
+        return
+
+    # The first worker serves the socket bound above; the rest bind their own
+    # SO_REUSEPORT sockets and the kernel spreads connections across them
+    sys.stdout.flush()
+    children: Set[int] = set()
+    for index in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(server_address, httpd if index == 0 else None)
+        children.add(pid)
+    httpd.server_close()
+
+    failed = _supervise_workers(children)
+    print("\n\n✅ Mock server stopped")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    run_server()
+    # Worker processes sharing the port via SO_REUSEPORT (MOCK_WORKERS=N)
+    try:
+        workers = int(os.environ.get("MOCK_WORKERS", "1"))
+    except ValueError:
+        sys.exit(f"MOCK_WORKERS must be an integer, got {os.environ['MOCK_WORKERS']!r}")
+    run_server(workers=workers)
@@ -4,86 +4,117 @@ Comprehensive Python Helper Function Tests
 Tests all 15 helper functions with known test vectors
 """
 
+import contextlib
+import functools
+import io
 import sys
 import os
+import traceback
+from datetime import datetime
 
 # Add the SDK to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'dist/python/src'))
 
 from circular_protocol_api import CircularProtocolAPI
 
+_HR80 = "=" * 80
+
+def _buffered(test_func):
+    """Collect a test's output and write it to stdout in one call"""
+    @functools.wraps(test_func)
+    def wrapper():
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return test_func()
+        finally:
+            sys.stdout.write(buf.getvalue())
+    return wrapper
+
+@functools.lru_cache(maxsize=1)
+def _api():
+    """Shared SDK instance reused by every helper test"""
+    return CircularProtocolAPI()
+
+def _is_hex(value):
+    """True if value is an even-length string of hex digits"""
+    # bytes.fromhex skips whitespace, so reject it before decoding
+    if not (value.isascii() and value.isalnum()):
+        return False
+    try:
+        bytes.fromhex(value)
+    except ValueError:
+        return False
+    return True
+
+@_buffered
 def test_configuration_helpers():
     """Test NAG URL and API key configuration"""
-    print("=" * 80)
+    print(_HR80)
     print("TEST 1: Configuration Helpers")
-    print("=" * 80)
+    print(_HR80)
 
-    api = CircularProtocolAPI()
+    api = _api()
 
     # Test default NAG URL
     default_url = api.get_nag_url()
     print(f"✓ Default NAG URL: {default_url}")
     assert default_url == 'https://nag.circularlabs.io/NAG.php?cep=', "Default NAG URL incorrect"
 
-    # Test setNAGURL
-    test_url = 'https://testnet.circularlabs.io/NAG.php?cep='
-    api.set_nag_url(test_url)
-    assert api.get_nag_url() == test_url, "setNAGURL failed"
-    print(f"✓ Set NAG URL: {api.get_nag_url()}")
-
-    # Test NAG key
-    api.set_nag_key('test-api-key-123')
-    assert api.get_nag_key() == 'test-api-key-123', "setNAGKey failed"
-    print(f"✓ NAG key set: {api.get_nag_key()}")
+    # Snapshot configuration so the shared instance is left untouched
+    original_key = api.get_nag_key()
+    try:
+        # Test setNAGURL
+        test_url = 'https://testnet.circularlabs.io/NAG.php?cep='
+        api.set_nag_url(test_url)
+        assert api.get_nag_url() == test_url, "setNAGURL failed"
+        print(f"✓ Set NAG URL: {api.get_nag_url()}")
+
+        # Test NAG key
+        api.set_nag_key('test-api-key-123')
+        assert api.get_nag_key() == 'test-api-key-123', "setNAGKey failed"
+        print(f"✓ NAG key set: {api.get_nag_key()}")
+    finally:
+        api.set_nag_url(default_url)
+        api.set_nag_key(original_key)
 
     print("✅ Configuration helpers: PASSED\n")
     return True
 
+@_buffered
 def test_timestamp_helper():
     """Test timestamp formatting"""
-    print("=" * 80)
+    print(_HR80)
     print("TEST 2: Timestamp Formatting")
-    print("=" * 80)
+    print(_HR80)
 
-    api = CircularProtocolAPI()
+    api = _api()
     timestamp = api.get_formatted_timestamp()
 
     print(f"✓ Timestamp: {timestamp}")
 
     # Verify format: YYYY:MM:DD-hh:mm:ss
-    import re
-    pattern = r'^\d{4}:\d{2}:\d{2}-\d{2}:\d{2}:\d{2}$'
-    assert re.match(pattern, timestamp), f"Invalid timestamp format: {timestamp}"
-
-    # Verify components are valid
-    parts = timestamp.split(':')
-    date_parts = parts[2].split('-')
-
-    year = int(parts[0])
-    month = int(parts[1])
-    day = int(date_parts[0])
-    hour = int(date_parts[1])
-    minute = int(parts[3])
-    second = int(parts[4])
-
-    assert 2020 <= year <= 2030, f"Invalid year: {year}"
-    assert 1 <= month <= 12, f"Invalid month: {month}"
-    assert 1 <= day <= 31, f"Invalid day: {day}"
-    assert 0 <= hour <= 23, f"Invalid hour: {hour}"
-    assert 0 <= minute <= 59, f"Invalid minute: {minute}"
-    assert 0 <= second <= 59, f"Invalid second: {second}"
+    # strptime range-checks every component; the length check rules out
+    # unpadded fields, which strptime would otherwise accept
+    try:
+        parsed = datetime.strptime(timestamp, "%Y:%m:%d-%H:%M:%S")
+    except ValueError:
+        parsed = None
+    assert parsed and len(timestamp) == 19, f"Invalid timestamp format: {timestamp}"
+    assert 2020 <= parsed.year <= 2030, f"Invalid year: {parsed.year}"
 
     print(f"✓ Format valid: YYYY:MM:DD-hh:mm:ss")
     print("✅ Timestamp helper: PASSED\n")
     return True
 
+@_buffered
 def test_hex_encoding_helpers():
     """Test hex encoding/decoding"""
-    print("=" * 80)
+    print(_HR80)
     print("TEST 3: Hex Encoding Helpers")
-    print("=" * 80)
+    print(_HR80)
 
-    api = CircularProtocolAPI()
+    api = _api()
 
     # Test stringToHex / hexToString
     test_string = "Hello Circular Protocol!"
@@ -111,13 +142,14 @@ def test_hex_encoding_helpers():
     print("✅ Hex encoding helpers: PASSED\n")
     return True
 
+@_buffered
 def test_crypto_helpers():
     """Test cryptographic operations with known test vectors"""
-    print("=" * 80)
+    print(_HR80)
     print("TEST 4: Cryptographic Helpers")
-    print("=" * 80)
+    print(_HR80)
 
-    api = CircularProtocolAPI()
+    api = _api()
 
     # Known test vector (from circular-js reference)
     private_key = '0f55c0c43496a9c3e1813180bec90e610769e15354771aebe7e28e83b3f89e8a'
@@ -131,7 +163,7 @@ def test_crypto_helpers():
         public_key = api.get_public_key(private_key)
         print(f"✓ Public key derived: {public_key[:40]}... (length: {len(public_key)})")
         assert len(public_key) >= 64, f"Public key too short: {len(public_key)}"
-        assert all(c in '0123456789abcdefABCDEF' for c in public_key), "Public key not hex"
+        assert _is_hex(public_key), "Public key not hex"
     except Exception as e:
         print(f"❌ getPublicKey failed: {e}")
         return False
@@ -141,7 +173,7 @@ def test_crypto_helpers():
         signature = api.sign_message(test_message, private_key)
         print(f"✓ Message signed: {signature[:40]}... (length: {len(signature)})")
         assert len(signature) >= 64, f"Signature too short: {len(signature)}"
-        assert all(c in '0123456789abcdefABCDEF' for c in signature), "Signature not hex"
+        assert _is_hex(signature), "Signature not hex"
     except Exception as e:
         print(f"❌ signMessage failed: {e}")
         return False
@@ -171,7 +203,7 @@ def test_crypto_helpers():
         hash_output = api.hash_string(hash_input)
         print(f"✓ SHA256 hash: {hash_output}")
         assert len(hash_output) == 64, f"Hash wrong length: {len(hash_output)}"
-        assert all(c in '0123456789abcdef' for c in hash_output), "Hash not lowercase hex"
+        assert _is_hex(hash_output) and hash_output == hash_output.lower(), "Hash not lowercase hex"
 
         # Verify hash is deterministic
         hash_output2 = api.hash_string(hash_input)
@@ -184,13 +216,14 @@ def test_crypto_helpers():
     print("✅ Cryptographic helpers: PASSED\n")
     return True
 
+@_buffered
 def test_error_tracking():
     """Test error tracking functionality"""
-    print("=" * 80)
+    print(_HR80)
     print("TEST 5: Error Tracking")
-    print("=" * 80)
+    print(_HR80)
 
-    api = CircularProtocolAPI()
+    api = _api()
 
     initial_error = api.get_error()
     print(f"✓ Initial error state: '{initial_error}'")
@@ -199,12 +232,21 @@ def test_error_tracking():
     print("✅ Error tracking: PASSED\n")
     return True
 
+def _run_test(name, test_func):
+    """Run a single test suite, reporting any exception as a failure"""
+    try:
+        return bool(test_func())
+    except Exception as e:
+        print(f"❌ {name} FAILED with exception: {e}")
+        traceback.print_exc()
+        return False
+
 def run_all_tests():
     """Run all helper function tests"""
-    print("\n" + "=" * 80)
+    print("\n" + _HR80)
     print("CIRCULAR PROTOCOL - PYTHON SDK HELPER TESTS")
     print("Testing all 15 helper functions")
-    print("=" * 80 + "\n")
+    print(_HR80 + "\n")
 
     tests = [
         ("Configuration Helpers (4)", test_configuration_helpers),
@@ -214,29 +256,20 @@ def run_all_tests():
         ("Error Tracking (1)", test_error_tracking),
     ]
 
-    results = []
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ {name} FAILED with exception: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+    results = [(name, _run_test(name, test_func)) for name, test_func in tests]
 
     # Summary
-    print("=" * 80)
+    print(_HR80)
     print("TEST SUMMARY")
-    print("=" * 80)
-    passed = sum(1 for _, result in results if result)
+    print(_HR80)
+    passed = sum(result for _, result in results)
     total = len(results)
 
     for name, result in results:
         status = "✅ PASSED" if result else "❌ FAILED"
         print(f"{status} - {name}")
 
-    print("=" * 80)
+    print(_HR80)
     print(f"Results: {passed}/{total} test suites passed")
 
     if passed == total: